@@ -16,7 +16,6 @@
 
 import json
 import traceback
-from ast import literal_eval
 from base64 import b64decode, b64encode
 from os import environ, path
 from pprint import pprint
@@ -38,6 +37,7 @@ from .platforms import auto_mount as auto_mount_modifier
 from .projects import load_project
 from .run import get_object, import_function, import_function_to_dict, new_function
 from .runtimes import RemoteRuntime, RunError, RuntimeKinds, ServingRuntime
+from .runtimes.funcdoc import py_eval
 from .secrets import SecretsStore
 from .utils import (
     RunNotifications,
@@ -933,14 +933,6 @@ def fill_params(params, params_dict=None):
     return params_dict
 
 
-def py_eval(data):
-    try:
-        value = literal_eval(data)
-        return value
-    except (SyntaxError, ValueError):
-        return data
-
-
 def set_item(obj, item, key, value=None):
     if item:
         if value:
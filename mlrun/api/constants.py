@@ -1,7 +1,7 @@
 from enum import Enum
 
 
-class LogSources(Enum):
+class LogSources(str, Enum):
     AUTO = "auto"
     PERSISTENCY = "persistency"
     K8S = "k8s"
@@ -31,8 +31,8 @@ class Entity(BaseModel):
 
 
 class FeatureSetSpec(ObjectSpec):
-    entities: List[Entity] = []
-    features: List[Feature] = []
+    entities: List[Entity] = Field(default_factory=list)
+    features: List[Feature] = Field(default_factory=list)
 
 
 class FeatureSet(BaseModel):
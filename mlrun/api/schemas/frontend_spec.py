@@ -5,4 +5,4 @@ import pydantic
 
 class FrontendSpec(pydantic.BaseModel):
     jobs_dashboard_url: typing.Optional[str]
-    abortable_function_kinds: typing.List[str] = []
+    abortable_function_kinds: typing.List[str] = pydantic.Field(default_factory=list)
@@ -134,7 +134,7 @@ class GrafanaStringColumn(GrafanaColumn):
 
 class GrafanaTable(BaseModel):
     columns: List[GrafanaColumn]
-    rows: List[List[Optional[Union[float, int, str]]]] = []
+    rows: List[List[Optional[Union[float, int, str]]]] = Field(default_factory=list)
     type: str = "table"
 
     def add_row(self, *args):
@@ -148,7 +148,7 @@ class GrafanaDataPoint(BaseModel):
 
 class GrafanaTimeSeriesTarget(BaseModel):
     target: str
-    datapoints: List[Tuple[float, int]] = []
+    datapoints: List[Tuple[float, int]] = Field(default_factory=list)
 
     def add_data_point(self, data_point: GrafanaDataPoint):
         self.datapoints.append((data_point.value, data_point.timestamp))
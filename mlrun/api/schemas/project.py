@@ -65,8 +65,8 @@ class ProjectSpec(pydantic.BaseModel):
 class Project(pydantic.BaseModel):
     kind: ObjectKind = pydantic.Field(ObjectKind.project, const=True)
     metadata: ProjectMetadata
-    spec: ProjectSpec = ProjectSpec()
-    status: ObjectStatus = ObjectStatus()
+    spec: ProjectSpec = pydantic.Field(default_factory=ProjectSpec)
+    status: ObjectStatus = pydantic.Field(default_factory=ObjectStatus)
 
 
 class ProjectSummary(pydantic.BaseModel):
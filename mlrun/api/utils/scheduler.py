@@ -329,11 +329,13 @@ class Scheduler:
         schedule_record: schemas.ScheduleRecord,
         include_last_run: bool = False,
     ) -> schemas.ScheduleOutput:
-        schedule_dict = schedule_record.dict()
-        schedule_dict["labels"] = {
-            label["name"]: label["value"] for label in schedule_dict["labels"]
+        # the record was already validated when loaded from the DB, build the output from its (shallow) fields
+        # without dumping it to a dict and validating it all over again
+        schedule_fields = dict(schedule_record)
+        schedule_fields["labels"] = {
+            label.name: label.value for label in schedule_record.labels
         }
-        schedule = schemas.ScheduleOutput(**schedule_dict)
+        schedule = schemas.ScheduleOutput.construct(**schedule_fields)
 
         job_id = self._resolve_job_id(schedule_record.project, schedule_record.name)
         job = self._scheduler.get_job(job_id)
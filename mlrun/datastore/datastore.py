@@ -159,13 +159,13 @@ class StoreManager:
             return in_memory_store, subpath
 
         if not schema and endpoint:
-            if endpoint in self._stores.keys():
+            if endpoint in self._stores:
                 return self._stores[endpoint], subpath
             else:
                 raise ValueError(f"no such store ({endpoint})")
 
         store_key = f"{schema}://{endpoint}"
-        if store_key in self._stores.keys():
+        if store_key in self._stores:
             return self._stores[store_key], subpath
 
         store = schema_to_store(schema)(self, schema, store_key, endpoint)
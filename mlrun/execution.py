@@ -866,9 +866,9 @@ class MLClientCtx(object):
         self._data_stores.to_dict(struct["spec"])
         return struct
 
-    def to_yaml(self):
-        """convert the run context to a yaml buffer"""
-        return dict_to_yaml(self.to_dict())
+    def to_yaml(self, stream=None):
+        """convert the run context to a yaml buffer, write it to the stream (file-like object) if given"""
+        return dict_to_yaml(self.to_dict(), stream)
 
     def to_json(self):
         """convert the run context to a json buffer"""
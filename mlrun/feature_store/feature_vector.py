@@ -255,7 +255,7 @@ class FeatureVector(ModelObj):
             self.status.label_column = alias or name
 
         def add_feature(name, alias, feature_set_object):
-            if alias in processed_features.keys():
+            if alias in processed_features:
                 raise mlrun.errors.MLRunInvalidArgumentError(
                     f"feature name/alias {alias} already specified,"
                     " use another alias (feature-set:name[@alias])"
@@ -267,7 +267,7 @@ class FeatureVector(ModelObj):
 
         for feature in features:
             feature_set, feature_name, alias = parse_feature_string(feature)
-            if feature_set not in feature_set_objects.keys():
+            if feature_set not in feature_set_objects:
                 feature_set_objects[feature_set] = get_feature_set_by_uri(
                     feature_set, self.metadata.project
                 )
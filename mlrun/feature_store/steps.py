@@ -60,7 +60,7 @@ class MapValues(MapClass):
         feature_map = self.mapping.get(feature, {})
 
         # Is it a string replacement?
-        if type(value) is str:
+        if isinstance(value, str):
             return feature_map.get(value, value)
 
         # Is it a range replacement?
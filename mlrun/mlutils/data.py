@@ -18,7 +18,7 @@ def get_sample(
                    sample consecutively from the first row
     :param label:  label column title
     """
-    if type(src) == pd.core.frame.DataFrame:
+    if isinstance(src, pd.DataFrame):
         table = src
     else:
         table = src.as_df()
@@ -108,7 +108,7 @@ def save_test_set(
     :param debug:      (False)
     """
 
-    if all(x in data.keys() for x in ["xtest", "ytest"]):
+    if all(x in data for x in ["xtest", "ytest"]):
         test_set = pd.concat(
             [
                 pd.DataFrame(data=data["xtest"], columns=header),
@@ -118,7 +118,7 @@ def save_test_set(
         )
         context.log_dataset("test_set", df=test_set, format=file_ext, index=index)
 
-    if all(x in data.keys() for x in ["xcal", "ycal"]):
+    if all(x in data for x in ["xcal", "ycal"]):
         cal_set = pd.concat(
             [
                 pd.DataFrame(data=data["xcal"], columns=header),
@@ -52,7 +52,7 @@ class ModelObj:
         struct = {}
         fields = fields or self._dict_fields
         if not fields:
-            fields = list(inspect.signature(self.__init__).parameters.keys())
+            fields = self._get_init_fields()
         for t in fields:
             if not exclude or t not in exclude:
                 val = getattr(self, t, None)
@@ -71,7 +71,7 @@ class ModelObj:
         struct = {} if struct is None else struct
         fields = fields or cls._dict_fields
         if not fields:
-            fields = list(inspect.signature(cls.__init__).parameters.keys())
+            fields = cls._get_init_fields()
         new_obj = cls()
         if struct:
             for key, val in struct.items():
@@ -79,9 +79,18 @@ class ModelObj:
                     setattr(new_obj, key, val)
         return new_obj
 
-    def to_yaml(self):
-        """convert the object to yaml"""
-        return dict_to_yaml(self.to_dict())
+    @classmethod
+    def _get_init_fields(cls):
+        # inspecting the signature is costly, compute the __init__ parameter names (without self) once per class
+        fields = cls.__dict__.get("_init_fields")
+        if fields is None:
+            fields = list(inspect.signature(cls.__init__).parameters.keys())[1:]
+            cls._init_fields = fields
+        return fields
+
+    def to_yaml(self, stream=None):
+        """convert the object to yaml, write it to the stream (file-like object) if given"""
+        return dict_to_yaml(self.to_dict(), stream)
 
     def to_json(self):
         """convert the object to json"""
@@ -121,6 +130,9 @@ class ObjectDict:
     def __iter__(self):
         yield from self._children.keys()
 
+    def __contains__(self, name):
+        return name in self._children
+
     def __getitem__(self, name):
         return self._children[name]
 
@@ -153,12 +165,12 @@ class ObjectDict:
         return new_obj
 
     def _get_child_object(self, child, name):
-        if hasattr(child, "kind") and child.kind in self._classes_map.keys():
+        if hasattr(child, "kind") and child.kind in self._classes_map:
             child.name = name
             return child
         elif isinstance(child, dict):
             kind = child.get("kind", self._default_kind)
-            if kind not in self._classes_map.keys():
+            if kind not in self._classes_map:
                 raise ValueError(f"illegal object kind {kind}")
             child_obj = self._classes_map[kind].from_dict(child)
             child_obj.name = name
@@ -166,8 +178,8 @@ class ObjectDict:
         else:
             raise ValueError(f"illegal child (should be dict or child kind), {child}")
 
-    def to_yaml(self):
-        return dict_to_yaml(self.to_dict())
+    def to_yaml(self, stream=None):
+        return dict_to_yaml(self.to_dict(), stream)
 
     def to_json(self):
         return dict_to_json(self.to_dict())
@@ -234,7 +246,7 @@ class ObjectList:
         if isinstance(child, self._child_class):
             return child.name, child
         elif isinstance(child, dict):
-            if "name" not in child.keys():
+            if "name" not in child:
                 raise ValueError("illegal object no 'name' field")
             child_obj = self._child_class.from_dict(child)
             return child_obj.name, child_obj
@@ -16,6 +16,7 @@ import os
 import warnings
 from collections import namedtuple
 from datetime import datetime
+from functools import lru_cache
 from http import HTTPStatus
 from urllib.parse import urlparse
 
@@ -313,15 +314,13 @@ def v3io_cred(api="", user="", access_key=""):
     return _use_v3io_cred
 
 
+@lru_cache(maxsize=256)
 def split_path(mntpath=""):
     if mntpath[0] == "/":
         mntpath = mntpath[1:]
-    paths = mntpath.split("/")
-    container = paths[0]
-    subpath = ""
-    if len(paths) > 1:
-        subpath = mntpath[len(container) :]
-    return container, subpath
+    # split only on the first "/", the sub path keeps its leading "/" (or is empty)
+    container, separator, subpath = mntpath.partition("/")
+    return container, separator + subpath
 
 
 def v3io_to_vol(name, remote="~/", access_key="", user="", secret=None):
@@ -1412,7 +1412,7 @@ class MlrunProject(ModelObj):
             self.spec.context, self.spec.subpath, "project.yaml"
         )
         with open(filepath, "w") as fp:
-            fp.write(self.to_yaml())
+            self.to_yaml(stream=fp)
 
 
 class MlrunProjectLegacy(ModelObj):
@@ -1662,7 +1662,7 @@ class MlrunProjectLegacy(ModelObj):
         """save the project object into a file (default to project.yaml)"""
         filepath = filepath or path.join(self.context, self.subpath, "project.yaml")
         with open(filepath, "w") as fp:
-            fp.write(self.to_yaml())
+            self.to_yaml(stream=fp)
 
 
 def _init_function_from_dict(f, project):
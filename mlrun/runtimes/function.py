@@ -21,7 +21,6 @@ from time import sleep
 
 import nuclio
 import requests
-from aiohttp.client import ClientSession
 from kubernetes import client
 from nuclio.deploy import deploy_config, find_dashboard_url, get_deploy_status
 from nuclio.triggers import V3IOStreamTrigger
@@ -221,9 +220,7 @@ class RemoteRuntime(KubeResource):
             if source.startswith("v3io"):
                 source = f"http{source[len('v3io'):]}"
 
-            v3io_access_key = secrets.get(
-                "V3IO_ACCESS_KEY", getenv("V3IO_ACCESS_KEY", "")
-            )
+            v3io_access_key = self._resolve_secret(secrets, "V3IO_ACCESS_KEY")
             if v3io_access_key:
                 code_entry_attributes["headers"] = {
                     "headers": {"X-V3io-Session-Key": v3io_access_key}
@@ -236,14 +233,14 @@ class RemoteRuntime(KubeResource):
             code_entry_attributes["s3Bucket"] = bucket
             code_entry_attributes["s3ItemKey"] = item_key
 
-            code_entry_attributes["s3AccessKeyId"] = secrets.get(
-                "AWS_ACCESS_KEY_ID", getenv("AWS_ACCESS_KEY_ID", "")
+            code_entry_attributes["s3AccessKeyId"] = self._resolve_secret(
+                secrets, "AWS_ACCESS_KEY_ID"
             )
-            code_entry_attributes["s3SecretAccessKey"] = secrets.get(
-                "AWS_SECRET_ACCESS_KEY", getenv("AWS_SECRET_ACCESS_KEY", "")
+            code_entry_attributes["s3SecretAccessKey"] = self._resolve_secret(
+                secrets, "AWS_SECRET_ACCESS_KEY"
             )
-            code_entry_attributes["s3SessionToken"] = secrets.get(
-                "AWS_SESSION_TOKEN", getenv("AWS_SESSION_TOKEN", "")
+            code_entry_attributes["s3SessionToken"] = self._resolve_secret(
+                secrets, "AWS_SESSION_TOKEN"
             )
 
         # git
@@ -258,8 +255,8 @@ class RemoteRuntime(KubeResource):
                 code_entry_attributes["reference"] = reference
 
             code_entry_attributes["username"] = secrets.get("GIT_USERNAME", "")
-            code_entry_attributes["password"] = secrets.get(
-                "GIT_PASSWORD", getenv("GITHUB_TOKEN", "")
+            code_entry_attributes["password"] = self._resolve_secret(
+                secrets, "GIT_PASSWORD", env_key="GITHUB_TOKEN"
             )
 
         # update handler in function_handler
@@ -267,11 +264,13 @@ class RemoteRuntime(KubeResource):
 
         # populate spec with relevant fields
         config = nuclio.config.new_config()
-        update_in(config, "spec.handler", handler)
-        update_in(config, "spec.runtime", runtime)
-        update_in(config, "spec.build.path", source)
-        update_in(config, "spec.build.codeEntryType", code_entry_type)
-        update_in(config, "spec.build.codeEntryAttributes", code_entry_attributes)
+        nuclio_spec = config.setdefault("spec", {})
+        nuclio_spec.update(handler=handler, runtime=runtime)
+        nuclio_spec.setdefault("build", {}).update(
+            path=source,
+            codeEntryType=code_entry_type,
+            codeEntryAttributes=code_entry_attributes,
+        )
         self.spec.base_spec = config
 
         return self
@@ -305,11 +304,11 @@ class RemoteRuntime(KubeResource):
 
     def from_image(self, image):
         config = nuclio.config.new_config()
-        update_in(
-            config, "spec.handler", self.spec.function_handler or "main:handler",
+        nuclio_spec = config.setdefault("spec", {})
+        nuclio_spec.update(
+            handler=self.spec.function_handler or "main:handler", image=image
         )
-        update_in(config, "spec.image", image)
-        update_in(config, "spec.build.codeEntryType", "image")
+        nuclio_spec.setdefault("build", {})["codeEntryType"] = "image"
         self.spec.base_spec = config
 
     def serving(
@@ -462,6 +461,13 @@ class RemoteRuntime(KubeResource):
             raise ValueError("function or deploy process not found")
         return self.status.state, text, last_log_timestamp
 
+    @staticmethod
+    def _resolve_secret(secrets, key, env_key=None):
+        # only look the env var up when the secret wasn't passed explicitly
+        if key in secrets:
+            return secrets[key]
+        return getenv(env_key or key, "")
+
     @staticmethod
     def _resolve_git_reference_from_source(source):
         split_source = source.split("#")
@@ -499,10 +505,8 @@ class RemoteRuntime(KubeResource):
             return "s3"
         if source.startswith("git://"):
             return "git"
-
-        for archive_prefix in ["http://", "https://", "v3io://", "v3ios://"]:
-            if source.startswith(archive_prefix):
-                return "archive"
+        if source.startswith(("http://", "https://", "v3io://", "v3ios://")):
+            return "archive"
         return ""
 
     def _get_runtime_env(self):
@@ -650,6 +654,9 @@ class RemoteRuntime(KubeResource):
         return rundict
 
     async def _invoke_async(self, runs, url, headers, secrets):
+        # aiohttp is only needed for parallel runs, import it lazily to keep it out of the import time
+        from aiohttp.client import ClientSession
+
         results = RunList()
         tasks = []
 
@@ -700,12 +707,6 @@ def fake_nuclio_context(body, headers=None):
     return nuclio.Context(), nuclio.Event(body=body, headers=headers)
 
 
-def _fullname(project, name):
-    if project:
-        return f"{project}-{name}"
-    return name
-
-
 def get_fullname(name, project, tag):
     if project:
         name = f"{project}-{name}"
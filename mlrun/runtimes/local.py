@@ -94,7 +94,7 @@ class ParallelRunner:
         completed_iter = as_completed([])
         for task in tasks:
             resp = client.submit(
-                remote_handler_wrapper, task.to_json(), handler, self.spec.workdir
+                remote_handler_wrapper, task.to_dict(), handler, self.spec.workdir
             )
             completed_iter.add(resp)
             queued_runs += 1
@@ -292,9 +292,8 @@ def load_module(file_name, handler):
         raise RunError(f"cannot import from {file_name!r}")
     mod = imputil.module_from_spec(spec)
     spec.loader.exec_module(mod)
-    try:
-        fn = getattr(mod, handler)  # Will raise if name not found
-    except AttributeError:
+    fn = getattr(mod, handler, None)
+    if fn is None:
         raise RunError(f"handler {handler} not found in {file_name}")
 
     return mod, fn
@@ -29,6 +29,7 @@ from .utils import (
     apply_kfp,
     generate_resources,
     get_item_name,
+    get_k8s_api_client,
     get_resource_labels,
     set_named_item,
 )
@@ -117,7 +118,7 @@ class KubeResourceSpec(FunctionSpec):
 
     def to_dict(self, fields=None, exclude=None):
         struct = super().to_dict(fields, exclude=["affinity"])
-        api = client.ApiClient()
+        api = get_k8s_api_client()
         struct["affinity"] = api.sanitize_for_serialization(self.affinity)
         return struct
 
@@ -137,7 +138,7 @@ class KubeResourceSpec(FunctionSpec):
         if not affinity:
             return None
         if isinstance(affinity, dict):
-            api = client.ApiClient()
+            api = get_k8s_api_client()
             # not ideal to use their private method, but looks like that's the only option
             # Taken from https://github.com/kubernetes-client/python/issues/977
             affinity = api._ApiClient__deserialize(affinity, "V1Affinity")
@@ -161,7 +162,7 @@ class KubeResourceSpec(FunctionSpec):
             elif "nodeAffinity" in self.affinity:
                 # then it's already the sanitized version
                 return self.affinity
-        api = client.ApiClient()
+        api = get_k8s_api_client()
         return api.sanitize_for_serialization(self.affinity)
 
     def _set_volume_mount(self, volume_mount):
@@ -192,7 +193,7 @@ class KubeResource(BaseRuntime):
 
     def to_dict(self, fields=None, exclude=None, strip=False):
         struct = super().to_dict(fields, exclude, strip=strip)
-        api = client.ApiClient()
+        api = get_k8s_api_client()
         struct = api.sanitize_for_serialization(struct)
         if strip:
             spec = struct["spec"]
@@ -233,8 +234,17 @@ class KubeResource(BaseRuntime):
 
     def set_envs(self, env_vars):
         """set pod environment var key/value dict"""
+        # index the existing vars once instead of scanning the env list for every new var
+        env_indexes = {}
+        for i, var in enumerate(self.spec.env):
+            env_indexes.setdefault(get_item_name(var), i)
         for name, value in env_vars.items():
-            self.set_env(name, value)
+            new_var = client.V1EnvVar(name=name, value=str(value))
+            if name in env_indexes:
+                self.spec.env[env_indexes[name]] = new_var
+            else:
+                env_indexes[name] = len(self.spec.env)
+                self.spec.env.append(new_var)
         return self
 
     def gpus(self, gpus, gpu_type="nvidia.com/gpu"):
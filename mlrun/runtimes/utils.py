@@ -56,6 +56,18 @@ global_context = _ContextStore()
 cached_mpijob_crd_version = None
 
 
+# the k8s api client is only used for (de)serializing k8s objects, creating one builds a configuration and a
+# connection pool, so share a single instance instead of creating one per call
+_k8s_api_client = None
+
+
+def get_k8s_api_client():
+    global _k8s_api_client
+    if not _k8s_api_client:
+        _k8s_api_client = client.ApiClient()
+    return _k8s_api_client
+
+
 # resolve mpijob runtime according to the mpi-operator's supported crd-version
 # if specified on mlrun config set it likewise,
 # if not specified, try resolving it according to the mpi-operator, otherwise set to default
@@ -289,7 +301,7 @@ def get_item_name(item, attr="name"):
 
 def apply_kfp(modify, cop, runtime):
     modify(cop)
-    api = client.ApiClient()
+    api = get_k8s_api_client()
     for k, v in cop.pod_labels.items():
         runtime.metadata.labels[k] = v
     for k, v in cop.pod_annotations.items():
@@ -563,7 +563,7 @@ class VotingEnsemble(BaseModelRouter):
         List
             The model's predictions
         """
-        if type(response) == list:
+        if isinstance(response, list):
             return response
         try:
             self.format_response_with_col_name_flag = True
@@ -298,7 +298,7 @@ class TaskState(BaseState):
             else:
                 self._handler = get_function(self.handler, namespace)
             args = signature(self._handler).parameters
-            if args and "context" in list(args.keys()):
+            if args and "context" in args:
                 self._inject_context = True
             return
 
@@ -682,7 +682,7 @@ class FlowState(BaseState):
             if after == "$prev" and self._last_added:
                 previous = self._last_added.name
             else:
-                if after not in self._states.keys():
+                if after not in self._states:
                     raise MLRunInvalidArgumentError(
                         f"cant set after, there is no state named {after}"
                     )
@@ -690,7 +690,7 @@ class FlowState(BaseState):
             state.after_state(previous)
 
         if before:
-            if before not in self._states.keys():
+            if before not in self._states:
                 raise MLRunInvalidArgumentError(
                     f"cant set before, there is no state named {before}"
                 )
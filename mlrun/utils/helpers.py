@@ -19,6 +19,7 @@ import re
 import sys
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from importlib import import_module
 from os import environ, path
 from types import ModuleType
@@ -145,12 +146,15 @@ def to_date_str(d):
     return ""
 
 
+# whitespace runs and underscores are both replaced with "-"
+_name_separators_regex = re.compile(r"\s+|_")
+
+
+@lru_cache(maxsize=256)
 def normalize_name(name):
     # TODO: Must match
     # [a-z0-9]([-a-z0-9]*[a-z0-9])?(\\.[a-z0-9]([-a-z0-9]*[a-z0-9])?
-    name = re.sub(r"\s+", "-", name)
-    name = name.replace("_", "-")
-    return name.lower()
+    return _name_separators_regex.sub("-", name).lower()
 
 
 class LogBatchWriter:
@@ -322,18 +326,29 @@ def date_representer(dumper, data):
     return dumper.represent_scalar("tag:yaml.org,2002:timestamp", value)
 
 
-yaml.add_representer(np.int64, int_representer, Dumper=yaml.SafeDumper)
-yaml.add_representer(np.integer, int_representer, Dumper=yaml.SafeDumper)
-yaml.add_representer(np.float64, float_representer, Dumper=yaml.SafeDumper)
-yaml.add_representer(np.floating, float_representer, Dumper=yaml.SafeDumper)
-yaml.add_representer(np.ndarray, numpy_representer_seq, Dumper=yaml.SafeDumper)
-yaml.add_representer(np.datetime64, date_representer, Dumper=yaml.SafeDumper)
-yaml.add_representer(Timestamp, date_representer, Dumper=yaml.SafeDumper)
+# use the libyaml (C) dumper when available, it is much faster than the pure python one. note that it may wrap long
+# quoted scalars at different points than the pure python dumper (the loaded data is the same)
+_yaml_dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
+for _dumper in {yaml.SafeDumper, _yaml_dumper}:
+    yaml.add_representer(np.int64, int_representer, Dumper=_dumper)
+    yaml.add_representer(np.integer, int_representer, Dumper=_dumper)
+    yaml.add_representer(np.float64, float_representer, Dumper=_dumper)
+    yaml.add_representer(np.floating, float_representer, Dumper=_dumper)
+    yaml.add_representer(np.ndarray, numpy_representer_seq, Dumper=_dumper)
+    yaml.add_representer(np.datetime64, date_representer, Dumper=_dumper)
+    yaml.add_representer(Timestamp, date_representer, Dumper=_dumper)
 
-def dict_to_yaml(struct):
+
+def dict_to_yaml(struct, stream=None):
     try:
-        data = yaml.safe_dump(struct, default_flow_style=False, sort_keys=False)
+        data = yaml.dump(
+            struct,
+            stream,
+            Dumper=_yaml_dumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
     except RepresenterError as exc:
         raise ValueError(f"error: data result cannot be serialized to YAML, {exc}")
     return data
@@ -3,6 +3,7 @@ import os
 import deepdiff
 import pytest
 from fastapi.testclient import TestClient
+from kubernetes import client as k8s_client
 from sqlalchemy.orm import Session
 
 import mlrun.errors
@@ -205,6 +206,42 @@ def my_func(context):
         self._execute_run(runtime)
         self._assert_pod_creation_config(expected_env=env2)
 
+    def test_set_envs(self, db: Session, client: TestClient):
+        def _generate_runtime_with_env():
+            runtime = self._generate_runtime()
+            runtime.spec.env = [
+                {"name": "DICT_ENV", "value": "old"},
+                k8s_client.V1EnvVar(name="DUPLICATE_ENV", value="first"),
+                k8s_client.V1EnvVar(name="DUPLICATE_ENV", value="second"),
+                k8s_client.V1EnvVar(name="UNCHANGED_ENV", value="unchanged"),
+            ]
+            return runtime
+
+        env = {
+            "NEW_ENV1": 1,
+            "DUPLICATE_ENV": "updated",
+            "DICT_ENV": "updated",
+            "NEW_ENV2": "new",
+        }
+        runtime = _generate_runtime_with_env()
+        runtime.set_envs(env)
+        # existing vars (including dict ones) are replaced in place, only the first of duplicate names is replaced
+        # and new vars are appended in the given order
+        assert runtime.spec.env == [
+            k8s_client.V1EnvVar(name="DICT_ENV", value="updated"),
+            k8s_client.V1EnvVar(name="DUPLICATE_ENV", value="updated"),
+            k8s_client.V1EnvVar(name="DUPLICATE_ENV", value="second"),
+            k8s_client.V1EnvVar(name="UNCHANGED_ENV", value="unchanged"),
+            k8s_client.V1EnvVar(name="NEW_ENV1", value="1"),
+            k8s_client.V1EnvVar(name="NEW_ENV2", value="new"),
+        ]
+
+        # set_envs should behave the same as calling set_env for each var
+        expected_runtime = _generate_runtime_with_env()
+        for name, value in env.items():
+            expected_runtime.set_env(name, value)
+        assert runtime.spec.env == expected_runtime.spec.env
+
     def test_run_with_code_with_file(self, db: Session, client: TestClient):
         runtime = self._generate_runtime()
 
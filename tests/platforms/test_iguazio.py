@@ -9,6 +9,7 @@ import requests
 import mlrun
 import mlrun.errors
 from mlrun.platforms import add_or_refresh_credentials
+from mlrun.platforms.iguazio import split_path
 
 
 def test_add_or_refresh_credentials_iguazio_2_8_success(monkeypatch):
@@ -359,3 +360,19 @@ def test_mount_v3io_extended():
                 )
                 == {}
             )
+
+
+@pytest.mark.parametrize(
+    "path,expected_container,expected_subpath",
+    [
+        ("/container", "container", ""),
+        ("container", "container", ""),
+        ("container/a/b", "container", "/a/b"),
+        ("/container/a/b", "container", "/a/b"),
+        ("//x", "", "/x"),
+        ("container/", "container", "/"),
+        ("/container/a/", "container", "/a/"),
+    ],
+)
+def test_split_path(path, expected_container, expected_subpath):
+    assert split_path(path) == (expected_container, expected_subpath)
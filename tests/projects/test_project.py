@@ -125,3 +125,23 @@ def test_user_project():
     assert (
         project.metadata.name == f"{project_name}-{user}"
     ), "project name doesnt include user name"
+
+
+def test_export_project_round_trip():
+    project_name = "project-name"
+    project = mlrun.new_project(project_name)
+    project.spec.description = "project description"
+    project.spec.artifact_path = "/tmp"
+    project.params["param-key"] = "param-value"
+    project_file_path = pathlib.Path(tests.conftest.results) / "project.yaml"
+    project.export(str(project_file_path))
+    assert project_file_path.read_text() == project.to_yaml()
+
+    imported_project = mlrun.load_project(None, str(project_file_path))
+    assert imported_project.metadata.name == project_name
+    assert imported_project.spec.description == project.spec.description
+    assert imported_project.spec.artifact_path == project.spec.artifact_path
+    assert (
+        deepdiff.DeepDiff(project.params, imported_project.params, ignore_order=True,)
+        == {}
+    )
@@ -1,7 +1,10 @@
 import pytest
 
 import mlrun
+import mlrun.errors
+from mlrun.model import ObjectDict
 from mlrun.serving import GraphContext
+from mlrun.serving.states import classes_map
 from mlrun.utils import logger
 
 from .demo_states import *  # noqa
@@ -109,3 +112,24 @@ def test_on_error():
     logger.info(f"flow: {graph.to_yaml()}")
     resp = server.test(body=[])
     assert resp["error"] and resp["origin_state"] == "raiser", "error wasnt caught"
+
+
+def test_states_membership():
+    states = ObjectDict.from_dict(
+        classes_map,
+        {"s1": {"class_name": "Chain"}, "s2": {"class_name": "Chain"}},
+        "task",
+    )
+    assert "s1" in states
+    assert "s2" in states
+    assert "s3" not in states
+
+
+def test_add_step_after_missing_state():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.add_step(name="s1", class_name="Chain")
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        graph.add_step(name="s2", class_name="Chain", after="not-exist")
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        graph.add_step(name="s3", class_name="Chain", before="not-exist")
@@ -1,15 +1,24 @@
+import datetime
+import io
+
+import numpy as np
+import pandas as pd
 import pytest
+import yaml
 
 import mlrun.errors
+import mlrun.utils.helpers
 from mlrun.config import config
 from mlrun.datastore.store_resources import parse_store_uri
 from mlrun.utils import logger
 from mlrun.utils.helpers import (
     StorePrefix,
+    dict_to_yaml,
     enrich_image_url,
     extend_hub_uri_if_needed,
     fill_artifact_path_template,
     get_parsed_docker_registry,
+    normalize_name,
     verify_field_regex,
 )
 from mlrun.utils.regex import run_name
@@ -285,3 +294,45 @@ def test_fill_artifact_path_template():
                 case["artifact_path"], case.get("project")
             )
             assert case["expected_artifact_path"] == filled_artifact_path
+
+
+@pytest.mark.parametrize(
+    "dumper", [yaml.SafeDumper, getattr(yaml, "CSafeDumper", yaml.SafeDumper)]
+)
+def test_dict_to_yaml_numpy_and_pandas_types(monkeypatch, dumper):
+    # the representers are registered on both the pure python and the libyaml dumpers
+    monkeypatch.setattr(mlrun.utils.helpers, "_yaml_dumper", dumper)
+    struct = {
+        "int": np.int64(3),
+        "float": np.float64(1.5),
+        "array": np.array([1, 2, 3]),
+        "datetime": np.datetime64("2021-03-04T05:06:07"),
+        "timestamp": pd.Timestamp("2021-03-04T05:06:07"),
+    }
+    assert yaml.safe_load(dict_to_yaml(struct)) == {
+        "int": 3,
+        "float": 1.5,
+        "array": [1, 2, 3],
+        "datetime": datetime.datetime(2021, 3, 4, 5, 6, 7),
+        "timestamp": datetime.datetime(2021, 3, 4, 5, 6, 7),
+    }
+
+
+def test_dict_to_yaml_stream():
+    struct = {"kind": "project", "spec": {"params": {"key": 1}, "functions": [{}]}}
+    stream = io.StringIO()
+    assert dict_to_yaml(struct, stream) is None
+    assert stream.getvalue() == dict_to_yaml(struct)
+
+
+def test_normalize_name():
+    cases = [
+        {"name": "my-func", "expected_name": "my-func"},
+        {"name": "My_func  Name", "expected_name": "my-func-name"},
+        {"name": "my_ func", "expected_name": "my--func"},
+        {"name": "my__func", "expected_name": "my--func"},
+        {"name": "my\t\nfunc", "expected_name": "my-func"},
+        {"name": "MY-FUNC", "expected_name": "my-func"},
+    ]
+    for case in cases:
+        assert normalize_name(case["name"]) == case["expected_name"]